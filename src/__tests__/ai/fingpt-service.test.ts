@@ -0,0 +1,55 @@
+/**
+ * CoreFlow360 - FinGPT Service Test Suite
+ * Tests the development sentiment scorer and its matched keywords
+ */
+
+import { describe, it, expect } from 'vitest'
+import { createFinGPTService } from '@/lib/ai/services/fingpt-service'
+import { SecurityContext } from '@/types/bundles'
+
+const context: SecurityContext = {
+  tenantId: 'test-tenant-fingpt',
+  userId: 'test-user-fingpt',
+  roles: ['analyst'],
+  permissions: ['ai:fingpt'],
+  sessionId: 'test-session',
+  ipAddress: '127.0.0.1',
+  bundleAccess: ['finance'],
+  rateLimit: { remaining: 100, resetTime: 0 },
+}
+
+describe('FinGPT Service', () => {
+  const service = createFinGPTService()
+
+  describe('sentimentAnalysis', () => {
+    it('should return the matched words in input order as keywords', async () => {
+      const result = await service.sentimentAnalysis(
+        'Strong Profit growth despite a minor loss',
+        context
+      )
+
+      expect(result.sentiment).toBe('positive')
+      expect(result.score).toBeCloseTo(2 / 7)
+      expect(result.keywords).toEqual(['profit', 'growth', 'loss'])
+      expect(result.reasoning).toBe('Detected 2 positive and 1 negative indicators')
+    })
+
+    it('should cap keywords at five matches', async () => {
+      const result = await service.sentimentAnalysis(
+        'growth increase profit success excellent loss decline',
+        context
+      )
+
+      expect(result.keywords).toEqual(['growth', 'increase', 'profit', 'success', 'excellent'])
+      expect(result.reasoning).toBe('Detected 5 positive and 2 negative indicators')
+    })
+
+    it('should return no keywords for text without sentiment words', async () => {
+      const result = await service.sentimentAnalysis('Quarterly results were published', context)
+
+      expect(result.sentiment).toBe('neutral')
+      expect(result.score).toBe(0)
+      expect(result.keywords).toEqual([])
+    })
+  })
+})
@@ -0,0 +1,77 @@
+/**
+ * CoreFlow360 - ERPNext Health Cache Tests
+ * Validates that health probes reuse recent healthy results without respawning Python
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest'
+import { EventEmitter } from 'events'
+import { NextRequest } from 'next/server'
+
+const { spawnMock } = vi.hoisted(() => ({ spawnMock: vi.fn() }))
+
+vi.mock('child_process', () => ({ spawn: spawnMock, default: { spawn: spawnMock } }))
+
+// Fake Python process that prints the given JSON and exits cleanly
+const fakePythonProcess = (output: unknown) => {
+  const child = Object.assign(new EventEmitter(), {
+    stdout: new EventEmitter(),
+    stderr: new EventEmitter(),
+    kill: vi.fn(),
+  })
+  setTimeout(() => {
+    child.stdout.emit('data', Buffer.from(JSON.stringify(output)))
+    child.emit('close', 0)
+  }, 0)
+  return child
+}
+
+const healthRequest = () => new NextRequest('http://localhost:3000/api/ai/erpnext?action=health')
+
+describe('ERPNext Health Cache', () => {
+  let GET: (request: NextRequest) => Promise<Response>
+
+  beforeEach(async () => {
+    spawnMock.mockReset()
+    // Fresh module per test so the module-level health cache starts empty
+    vi.resetModules()
+    ;({ GET } = await import('@/app/api/ai/erpnext/route'))
+  })
+
+  afterEach(() => {
+    vi.restoreAllMocks()
+  })
+
+  it('should reuse a healthy result within five seconds', async () => {
+    spawnMock.mockImplementation(() => fakePythonProcess({ success: true, status: 'ok' }))
+
+    const first = await (await GET(healthRequest())).json()
+    const second = await (await GET(healthRequest())).json()
+
+    expect(spawnMock).toHaveBeenCalledTimes(1)
+    expect(second.data).toEqual(first.data)
+    expect(second.data.status).toBe('ok')
+  })
+
+  it('should probe again once the cached result has expired', async () => {
+    spawnMock.mockImplementation(() => fakePythonProcess({ success: true, status: 'ok' }))
+    const now = vi.spyOn(performance, 'now').mockReturnValue(1000)
+
+    await GET(healthRequest())
+    now.mockReturnValue(1000 + 5001)
+    await GET(healthRequest())
+
+    expect(spawnMock).toHaveBeenCalledTimes(2)
+  })
+
+  it('should never cache an unhealthy result', async () => {
+    spawnMock.mockImplementation(() =>
+      fakePythonProcess({ success: false, error: 'ERPNext unavailable' })
+    )
+
+    const first = await (await GET(healthRequest())).json()
+    await GET(healthRequest())
+
+    expect(spawnMock).toHaveBeenCalledTimes(2)
+    expect(first.data.success).toBe(false)
+  })
+})
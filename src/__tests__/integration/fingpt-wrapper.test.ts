@@ -0,0 +1,76 @@
+/**
+ * CoreFlow360 - FinGPT Wrapper Sentiment Cache Tests
+ * Validates result reuse, copy isolation and tenant separation of the sentiment cache
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest'
+import { fingptWrapper } from '@/lib/external-services/fingpt-wrapper'
+import { serviceManager } from '@/lib/external-services/service-manager'
+
+vi.mock('@/lib/external-services/service-manager', () => ({
+  serviceManager: { callService: vi.fn() },
+}))
+
+const sentimentResponse = () => ({
+  sentiment: 'positive' as const,
+  confidence: 0.9,
+  aspects: [{ aspect: 'earnings', sentiment: 'positive', confidence: 0.88 }],
+  keywords: ['growth', 'profit'],
+})
+
+describe('FinGPT Wrapper Sentiment Cache', () => {
+  const callService = vi.mocked(serviceManager.callService)
+
+  beforeEach(() => {
+    callService.mockReset()
+    callService.mockImplementation(async () => sentimentResponse())
+  })
+
+  it('should reuse the result for a repeated request from the same tenant', async () => {
+    const request = { text: 'Apple posts record profit growth', context: 'earnings' }
+
+    const first = await fingptWrapper.analyzeSentiment(request, 'tenant_cache_hit')
+    const second = await fingptWrapper.analyzeSentiment({ ...request }, 'tenant_cache_hit')
+
+    expect(callService).toHaveBeenCalledTimes(1)
+    expect(second).toEqual(first)
+  })
+
+  it('should call the service again when the request differs', async () => {
+    await fingptWrapper.analyzeSentiment({ text: 'Bank margins widen' }, 'tenant_cache_miss')
+    await fingptWrapper.analyzeSentiment(
+      { text: 'Bank margins widen', language: 'de' },
+      'tenant_cache_miss'
+    )
+    await fingptWrapper.analyzeSentiment({ text: 'Bank margins narrow' }, 'tenant_cache_miss')
+
+    expect(callService).toHaveBeenCalledTimes(3)
+  })
+
+  it('should not share cached results across tenants', async () => {
+    const request = { text: 'Retail sales beat expectations' }
+
+    await fingptWrapper.analyzeSentiment(request, 'tenant_cache_a')
+    await fingptWrapper.analyzeSentiment(request, 'tenant_cache_b')
+
+    expect(callService).toHaveBeenCalledTimes(2)
+    expect(callService.mock.calls.map((call) => call[4])).toEqual([
+      'tenant_cache_a',
+      'tenant_cache_b',
+    ])
+  })
+
+  it('should not let callers mutate the cached result', async () => {
+    const request = { text: 'Chipmaker guidance raised again' }
+
+    const first = await fingptWrapper.analyzeSentiment(request, 'tenant_cache_copy')
+    first.keywords.push('mutated')
+    first.aspects[0].confidence = 0
+
+    const second = await fingptWrapper.analyzeSentiment(request, 'tenant_cache_copy')
+
+    expect(callService).toHaveBeenCalledTimes(1)
+    expect(second.keywords).toEqual(['growth', 'profit'])
+    expect(second.aspects[0].confidence).toBe(0.88)
+  })
+})
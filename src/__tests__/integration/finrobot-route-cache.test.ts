@@ -0,0 +1,87 @@
+/**
+ * CoreFlow360 - FinRobot Route Result Cache Tests
+ * Validates reuse of forecast results across requests without spawning Python
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest'
+import { EventEmitter } from 'events'
+import { spawn } from 'child_process'
+import { NextRequest } from 'next/server'
+import { POST as FinRobot_POST } from '@/app/api/ai/finrobot/route'
+
+vi.mock('child_process', () => {
+  const spawn = vi.fn()
+  return { spawn, default: { spawn } }
+})
+
+const PROCESS_DELAY_MS = 50
+
+// Fake Python process that prints the given JSON and exits cleanly after a short delay
+const fakePythonProcess = (output: unknown) => {
+  const child = Object.assign(new EventEmitter(), {
+    stdout: new EventEmitter(),
+    stderr: new EventEmitter(),
+    kill: vi.fn(),
+  })
+  setTimeout(() => {
+    child.stdout.emit('data', Buffer.from(JSON.stringify(output)))
+    child.emit('close', 0)
+  }, PROCESS_DELAY_MS)
+  return child
+}
+
+const forecastRequest = (tenantId: string, sector = 'technology') =>
+  new NextRequest('http://localhost:3000/api/ai/finrobot', {
+    method: 'POST',
+    body: JSON.stringify({
+      action: 'execute_forecast',
+      data: { current_revenue: 1500000, growth_rate: 0.12, sector },
+      forecast_type: 'revenue',
+      horizon_months: 12,
+      tenant_id: tenantId,
+      user_id: 'test_user_cache',
+    }),
+  })
+
+describe('FinRobot Route Result Cache', () => {
+  const spawnMock = vi.mocked(spawn)
+
+  beforeEach(() => {
+    spawnMock.mockReset()
+  })
+
+  it('should reuse a successful forecast and refresh its processing time', async () => {
+    spawnMock.mockImplementation(
+      () => fakePythonProcess({ success: true, forecast: [1, 2, 3] }) as never
+    )
+
+    const first = await (await FinRobot_POST(forecastRequest('tenant_cache_hit'))).json()
+    const second = await (await FinRobot_POST(forecastRequest('tenant_cache_hit'))).json()
+
+    expect(spawnMock).toHaveBeenCalledTimes(1)
+    expect(second.data.forecast).toEqual(first.data.forecast)
+    expect(first.data.api_processing_time_ms).toBeGreaterThanOrEqual(PROCESS_DELAY_MS - 5)
+    expect(second.data.api_processing_time_ms).toBeLessThan(PROCESS_DELAY_MS - 5)
+  })
+
+  it('should not cache in-band failures reported by the Python script', async () => {
+    spawnMock.mockImplementation(
+      () => fakePythonProcess({ success: false, error: 'boom', service: 'finrobot' }) as never
+    )
+
+    await FinRobot_POST(forecastRequest('tenant_cache_failure'))
+    await FinRobot_POST(forecastRequest('tenant_cache_failure'))
+
+    expect(spawnMock).toHaveBeenCalledTimes(2)
+  })
+
+  it('should spawn again for a different request or tenant', async () => {
+    spawnMock.mockImplementation(() => fakePythonProcess({ success: true }) as never)
+
+    await FinRobot_POST(forecastRequest('tenant_cache_miss_a'))
+    await FinRobot_POST(forecastRequest('tenant_cache_miss_a', 'retail'))
+    await FinRobot_POST(forecastRequest('tenant_cache_miss_b'))
+
+    expect(spawnMock).toHaveBeenCalledTimes(3)
+  })
+})
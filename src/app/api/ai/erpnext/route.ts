@@ -91,11 +91,16 @@ const CapabilitiesSchema = z.object({
   action: z.literal('capabilities'),
 })
 
+// Supported actions, listed once rather than rebuilt in every error response
+const POST_ACTIONS = ['process_payroll', 'optimize_bom', 'health_check', 'capabilities'] as const
+const GET_ACTIONS = ['capabilities', 'health'] as const
+
 // ============================================================================
 // ERPNEXT SERVICE INTEGRATION
 // ============================================================================
 
 class ERPNextServiceIntegration {
+  private static instance: ERPNextServiceIntegration
   private readonly servicePath: string
   private readonly pythonPath: string
 
@@ -111,9 +116,16 @@ class ERPNextServiceIntegration {
     this.pythonPath = process.platform === 'win32' ? 'python' : 'python3'
   }
 
+  static getInstance(): ERPNextServiceIntegration {
+    if (!ERPNextServiceIntegration.instance) {
+      ERPNextServiceIntegration.instance = new ERPNextServiceIntegration()
+    }
+    return ERPNextServiceIntegration.instance
+  }
+
   async executePythonService(request: unknown): Promise<unknown> {
     return new Promise((resolve, reject) => {
-      const startTime = Date.now()
+      const startTime = performance.now()
 
       // Spawn Python child process for tenant-isolated execution
       const pythonProcess = spawn(
@@ -121,11 +133,8 @@ class ERPNextServiceIntegration {
         [
           '-c',
           `
-import sys
-import os
 import json
 import asyncio
-sys.path.insert(0, "${path.dirname(this.servicePath)}")
 
 from integration import create_erpnext_integration
 
@@ -179,7 +188,7 @@ asyncio.run(execute())
       })
 
       pythonProcess.on('close', (code) => {
-        const executionTime = Date.now() - startTime
+        const executionTime = Math.round(performance.now() - startTime)
 
         if (code === 0) {
           try {
@@ -245,12 +254,33 @@ asyncio.run(execute())
   }
 }
 
+// Health probes poll frequently; reuse a recent healthy result instead of spawning Python each time
+const HEALTH_CACHE_TTL_MS = 5000
+let cachedHealth: { result: unknown; expiresAt: number } | null = null
+
+async function getHealth(erpnextService: ERPNextServiceIntegration): Promise<unknown> {
+  if (cachedHealth && performance.now() < cachedHealth.expiresAt) {
+    return cachedHealth.result
+  }
+
+  const result = await erpnextService.executePythonService({
+    action: 'health_check',
+    tenant_id: 'health_check',
+  })
+
+  if ((result as { success?: boolean }).success !== false) {
+    cachedHealth = { result, expiresAt: performance.now() + HEALTH_CACHE_TTL_MS }
+  }
+
+  return result
+}
+
 // ============================================================================
 // API ROUTE HANDLERS
 // ============================================================================
 
 export async function POST(request: NextRequest) {
-  const startTime = Date.now()
+  const startTime = performance.now()
 
   try {
     const body = await request.json()
@@ -276,19 +306,19 @@ export async function POST(request: NextRequest) {
           {
             success: false,
             error: `Unknown action: ${body.action}`,
-            available_actions: ['process_payroll', 'optimize_bom', 'health_check', 'capabilities'],
+            available_actions: POST_ACTIONS,
           },
           { status: 400 }
         )
     }
 
-    // Initialize ERPNext service integration
-    const erpnextService = new ERPNextServiceIntegration()
+    // Shared ERPNext service integration (paths resolved once per process)
+    const erpnextService = ERPNextServiceIntegration.getInstance()
 
     // Execute the request
     const result = await erpnextService.executePythonService(validatedRequest)
 
-    const totalExecutionTime = Date.now() - startTime
+    const totalExecutionTime = Math.round(performance.now() - startTime)
 
     return NextResponse.json({
       success: true,
@@ -301,7 +331,7 @@ export async function POST(request: NextRequest) {
       },
     })
   } catch (error) {
-    const executionTime = Date.now() - startTime
+    const executionTime = Math.round(performance.now() - startTime)
 
     if (error instanceof z.ZodError) {
       return NextResponse.json(
@@ -332,7 +362,7 @@ export async function GET(request: NextRequest) {
   const action = searchParams.get('action') || 'capabilities'
 
   try {
-    const erpnextService = new ERPNextServiceIntegration()
+    const erpnextService = ERPNextServiceIntegration.getInstance()
 
     if (action === 'capabilities') {
       const result = await erpnextService.executePythonService({ action: 'capabilities' })
@@ -343,10 +373,7 @@ export async function GET(request: NextRequest) {
         service: 'erpnext',
       })
     } else if (action === 'health') {
-      const result = await erpnextService.executePythonService({
-        action: 'health_check',
-        tenant_id: 'health_check',
-      })
+      const result = await getHealth(erpnextService)
 
       return NextResponse.json({
         success: true,
@@ -358,7 +385,7 @@ export async function GET(request: NextRequest) {
         {
           success: false,
           error: `Unknown GET action: ${action}`,
-          available_actions: ['capabilities', 'health'],
+          available_actions: GET_ACTIONS,
         },
         { status: 400 }
       )
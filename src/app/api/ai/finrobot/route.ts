@@ -9,6 +9,7 @@ import { NextRequest, NextResponse } from 'next/server'
 import { z } from 'zod'
 import { spawn } from 'child_process'
 import path from 'path'
+import { LRUCache } from 'lru-cache'
 
 // ============================================================================
 // VALIDATION SCHEMAS
@@ -55,6 +56,12 @@ class FinRobotServiceWrapper {
   private pythonPath: string
   private servicePath: string
 
+  // Dashboards re-issue identical requests; reuse recent results instead of respawning Python
+  private resultCache = new LRUCache<string, Record<string, unknown>>({
+    max: 128,
+    ttl: 1000 * 60 * 5, // 5 minutes
+  })
+
   constructor() {
     this.pythonPath = process.env.PYTHON_PATH || 'python3'
     this.servicePath = path.join(
@@ -75,15 +82,42 @@ class FinRobotServiceWrapper {
   }
 
   async executeForecast(request: ForecastRequest): Promise<unknown> {
+    return this.withResultCache(`forecast:${JSON.stringify(request)}`, () =>
+      this.spawnForecast(request)
+    )
+  }
+
+  async executeStrategicAnalysis(request: StrategicAnalysisRequest): Promise<unknown> {
+    return this.withResultCache(`strategic:${JSON.stringify(request)}`, () =>
+      this.spawnStrategicAnalysis(request)
+    )
+  }
+
+  private async withResultCache(key: string, execute: () => Promise<unknown>): Promise<unknown> {
+    const startTime = performance.now()
+    const cached = this.resultCache.get(key)
+    if (cached) {
+      return { ...cached, api_processing_time_ms: Math.round(performance.now() - startTime) }
+    }
+
+    const result = (await execute()) as Record<string, unknown> | null
+    // Errors are reported in-band by the Python script; only cache real (non-null) results
+    if (result && result.success !== false) {
+      this.resultCache.set(key, result)
+    }
+
+    return result
+  }
+
+  private spawnForecast(request: ForecastRequest): Promise<unknown> {
     return new Promise((resolve, reject) => {
-      const startTime = Date.now()
+      const startTime = performance.now()
 
       // Create Python integration call
       const python = spawn(this.pythonPath, [
         '-c',
         `
 import sys
-import os
 import json
 import asyncio
 sys.path.insert(0, "${path.dirname(this.servicePath)}")
@@ -128,7 +162,7 @@ asyncio.run(forecast())
       })
 
       python.on('close', (code) => {
-        const processingTime = Date.now() - startTime
+        const processingTime = Math.round(performance.now() - startTime)
 
         if (code !== 0) {
           reject(new Error(`FinRobot process failed with code ${code}: ${error}`))
@@ -152,15 +186,14 @@ asyncio.run(forecast())
     })
   }
 
-  async executeStrategicAnalysis(request: StrategicAnalysisRequest): Promise<unknown> {
+  private spawnStrategicAnalysis(request: StrategicAnalysisRequest): Promise<unknown> {
     return new Promise((resolve, reject) => {
-      const startTime = Date.now()
+      const startTime = performance.now()
 
       const python = spawn(this.pythonPath, [
         '-c',
         `
 import sys
-import os
 import json
 import asyncio
 sys.path.insert(0, "${path.dirname(this.servicePath)}")
@@ -204,7 +237,7 @@ asyncio.run(strategic_analysis())
       })
 
       python.on('close', (code) => {
-        const processingTime = Date.now() - startTime
+        const processingTime = Math.round(performance.now() - startTime)
 
         if (code !== 0) {
           reject(new Error(`FinRobot strategic analysis failed: ${error}`))
@@ -233,7 +266,6 @@ asyncio.run(strategic_analysis())
         '-c',
         `
 import sys
-import os
 import json
 import asyncio
 sys.path.insert(0, "${path.dirname(this.servicePath)}")
@@ -297,12 +329,59 @@ asyncio.run(health_check())
   }
 }
 
+// Static GET payloads, built once rather than on every poll
+const CAPABILITIES = {
+  service: 'finrobot',
+  name: 'FinRobot Multi-Agent Financial AI',
+  description: 'Advanced multi-agent financial forecasting and strategic analysis',
+  capabilities: [
+    'multi_agent_forecasting',
+    'strategic_analysis',
+    'cross_departmental_impact',
+    'risk_assessment',
+    'growth_opportunity_identification',
+    'comprehensive_business_analysis',
+  ],
+  agents: ['revenue', 'expenses', 'growth', 'risk', 'strategic'],
+  forecast_types: ['revenue', 'expenses', 'growth', 'risk', 'strategic', 'comprehensive'],
+  max_horizon_months: 60,
+  min_horizon_months: 1,
+  tenant_isolated: true,
+  pricing_tier: 'enterprise',
+}
+
+const SERVICE_INFO = {
+  service: 'finrobot',
+  name: 'FinRobot Multi-Agent Financial AI Service',
+  version: '1.0.0',
+  status: 'active',
+  endpoints: {
+    'POST /api/ai/finrobot': {
+      actions: ['execute_forecast', 'strategic_analysis', 'health_check'],
+      description: 'Main FinRobot multi-agent processing endpoint',
+    },
+    'GET /api/ai/finrobot?action=health&tenant_id=X': {
+      description: 'Health check for specific tenant',
+    },
+    'GET /api/ai/finrobot?action=capabilities': {
+      description: 'Get service capabilities',
+    },
+  },
+  integration: 'direct_code',
+  performance: {
+    avg_response_time: '< 500ms',
+    max_horizon_months: 60,
+    concurrent_requests: 25,
+    agents: 5,
+  },
+}
+
 // ============================================================================
 // API ROUTE HANDLERS
 // ============================================================================
 
 export async function POST(request: NextRequest) {
-  const startTime = Date.now()
+  const startTime = performance.now()
 
   try {
     const body = await request.json()
@@ -318,7 +397,7 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({
           success: true,
           data: result,
-          processing_time_ms: Date.now() - startTime,
+          processing_time_ms: Math.round(performance.now() - startTime),
           service: 'finrobot',
           action: 'execute_forecast',
         })
@@ -331,7 +410,7 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({
           success: true,
           data: result,
-          processing_time_ms: Date.now() - startTime,
+          processing_time_ms: Math.round(performance.now() - startTime),
           service: 'finrobot',
           action: 'strategic_analysis',
         })
@@ -348,7 +427,7 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({
           success: true,
           data: result,
-          processing_time_ms: Date.now() - startTime,
+          processing_time_ms: Math.round(performance.now() - startTime),
           service: 'finrobot',
           action: 'health_check',
         })
@@ -382,7 +461,7 @@ export async function POST(request: NextRequest) {
         success: false,
         error: error instanceof Error ? error.message : 'Unknown error',
         service: 'finrobot',
-        processing_time_ms: Date.now() - startTime,
+        processing_time_ms: Math.round(performance.now() - startTime),
       },
       { status: 500 }
     )
@@ -409,54 +488,12 @@ export async function GET(request: NextRequest) {
     if (action === 'capabilities') {
       return NextResponse.json({
         success: true,
-        data: {
-          service: 'finrobot',
-          name: 'FinRobot Multi-Agent Financial AI',
-          description: 'Advanced multi-agent financial forecasting and strategic analysis',
-          capabilities: [
-            'multi_agent_forecasting',
-            'strategic_analysis',
-            'cross_departmental_impact',
-            'risk_assessment',
-            'growth_opportunity_identification',
-            'comprehensive_business_analysis',
-          ],
-          agents: ['revenue', 'expenses', 'growth', 'risk', 'strategic'],
-          forecast_types: ['revenue', 'expenses', 'growth', 'risk', 'strategic', 'comprehensive'],
-          max_horizon_months: 60,
-          min_horizon_months: 1,
-          tenant_isolated: true,
-          pricing_tier: 'enterprise',
-        },
+        data: CAPABILITIES,
       })
     }
 
     // Default: Return service information
-    return NextResponse.json({
-      service: 'finrobot',
-      name: 'FinRobot Multi-Agent Financial AI Service',
-      version: '1.0.0',
-      status: 'active',
-      endpoints: {
-        'POST /api/ai/finrobot': {
-          actions: ['execute_forecast', 'strategic_analysis', 'health_check'],
-          description: 'Main FinRobot multi-agent processing endpoint',
-        },
-        'GET /api/ai/finrobot?action=health&tenant_id=X': {
-          description: 'Health check for specific tenant',
-        },
-        'GET /api/ai/finrobot?action=capabilities': {
-          description: 'Get service capabilities',
-        },
-      },
-      integration: 'direct_code',
-      performance: {
-        avg_response_time: '< 500ms',
-        max_horizon_months: 60,
-        concurrent_requests: 25,
-        agents: 5,
-      },
-    })
+    return NextResponse.json(SERVICE_INFO)
   } catch (error) {
     return NextResponse.json(
       {
@@ -6,18 +6,29 @@
 import { FinGPTService } from '../interfaces/ai-services'
 import { SecurityContext } from '@/types/bundles'
 
+// Sentiment vocabularies as Sets so each word is a hash lookup, not an array scan
+const POSITIVE_WORDS = new Set(['growth', 'increase', 'profit', 'success', 'excellent'])
+const NEGATIVE_WORDS = new Set(['loss', 'decrease', 'decline', 'failure', 'poor'])
+
 export function createFinGPTService(): FinGPTService {
   return {
-    async sentimentAnalysis(_text: string, _context: SecurityContext) {
+    async sentimentAnalysis(text: string, _context: SecurityContext) {
       // Production implementation would call actual FinGPT API
       // This is a mock implementation for development
 
       const keywords = text.toLowerCase().split(' ')
-      const positiveWords = ['growth', 'increase', 'profit', 'success', 'excellent']
-      const negativeWords = ['loss', 'decrease', 'decline', 'failure', 'poor']
 
-      const positiveCount = keywords.filter((w) => positiveWords.includes(w)).length
-      const negativeCount = keywords.filter((w) => negativeWords.includes(w)).length
+      // Tally both polarities in a single pass over the tokens
+      let positiveCount = 0
+      let negativeCount = 0
+      const matchedKeywords: string[] = []
+      for (const word of keywords) {
+        if (POSITIVE_WORDS.has(word)) positiveCount++
+        else if (NEGATIVE_WORDS.has(word)) negativeCount++
+        else continue
+
+        if (matchedKeywords.length < 5) matchedKeywords.push(word)
+      }
 
       let sentiment: 'positive' | 'negative' | 'neutral' = 'neutral'
       let score = 0
@@ -34,7 +45,7 @@ export function createFinGPTService(): FinGPTService {
         sentiment,
         score,
         confidence: 0.85,
-        keywords: keywords.slice(0, 5),
+        keywords: matchedKeywords,
         reasoning: `Detected ${positiveCount} positive and ${negativeCount} negative indicators`,
       }
     },
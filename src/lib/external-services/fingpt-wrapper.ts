@@ -3,7 +3,9 @@
  * Interface to FinGPT financial AI capabilities
  */
 
+import { createHash } from 'crypto'
 import { z } from 'zod'
+import { LRUCache } from 'lru-cache'
 import { ExternalResource } from '@/types/bundles'
 import { serviceManager } from './service-manager'
 
@@ -82,9 +84,75 @@ export interface FinancialForecastResponse {
   insights: string[]
 }
 
+// Response schemas, built once at module load rather than on every call
+const SentimentResponseSchema = z.object({
+  sentiment: z.enum(['positive', 'negative', 'neutral']),
+  confidence: z.number().min(0).max(1),
+  aspects: z.array(
+    z.object({
+      aspect: z.string(),
+      sentiment: z.string(),
+      confidence: z.number(),
+    })
+  ),
+  keywords: z.array(z.string()),
+  summary: z.string().optional(),
+})
+
+const AnomalyResponseSchema = z.object({
+  anomalies: z.array(
+    z.object({
+      timestamp: z.string(),
+      value: z.number(),
+      severity: z.enum(['low', 'medium', 'high', 'critical']),
+      explanation: z.string().optional(),
+      relatedFactors: z.array(z.string()).optional(),
+    })
+  ),
+  confidence: z.number().min(0).max(1),
+  baselineStats: z.object({
+    mean: z.number(),
+    stdDev: z.number(),
+    trend: z.enum(['increasing', 'decreasing', 'stable']),
+  }),
+})
+
+const ForecastResponseSchema = z.object({
+  forecast: z.array(
+    z.object({
+      timestamp: z.string(),
+      predicted: z.number(),
+      lower: z.number(),
+      upper: z.number(),
+      confidence: z.number().min(0).max(1),
+    })
+  ),
+  model: z.object({
+    type: z.string(),
+    accuracy: z.number().min(0).max(1),
+    parameters: z.record(z.any()),
+  }),
+  insights: z.array(z.string()),
+})
+
+// Cached responses must not be shared with callers, so every hit gets its own arrays
+const cloneSentimentResponse = (
+  response: FinancialSentimentResponse
+): FinancialSentimentResponse => ({
+  ...response,
+  aspects: response.aspects.map((aspect) => ({ ...aspect })),
+  keywords: [...response.keywords],
+})
+
 export class FinGPTWrapper {
   private static instance: FinGPTWrapper
 
+  // Repeated headlines/tickers are common in news feeds; reuse validated results briefly
+  private sentimentCache = new LRUCache<string, FinancialSentimentResponse>({
+    max: 4096,
+    ttl: 1000 * 60 * 5, // 5 minutes
+  })
+
   private constructor() {}
 
   static getInstance(): FinGPTWrapper {
@@ -101,6 +169,23 @@ export class FinGPTWrapper {
     request: FinancialSentimentRequest,
     tenantId: string
   ): Promise<FinancialSentimentResponse> {
+    // Key on a digest so whole documents from batchAnalyze are not retained as cache keys
+    const cacheKey = createHash('sha256')
+      .update(
+        JSON.stringify([
+          tenantId,
+          request.text,
+          request.context,
+          request.language,
+          request.includeConfidence,
+        ])
+      )
+      .digest('hex')
+    const cached = this.sentimentCache.get(cacheKey)
+    if (cached) {
+      return cloneSentimentResponse(cached)
+    }
+
     const response = await serviceManager.callService<FinancialSentimentResponse>(
       ExternalResource.FINGPT,
       '/sentiment',
@@ -109,22 +194,10 @@ export class FinGPTWrapper {
       tenantId
     )
 
-    // Validate response
-    const schema = z.object({
-      sentiment: z.enum(['positive', 'negative', 'neutral']),
-      confidence: z.number().min(0).max(1),
-      aspects: z.array(
-        z.object({
-          aspect: z.string(),
-          sentiment: z.string(),
-          confidence: z.number(),
-        })
-      ),
-      keywords: z.array(z.string()),
-      summary: z.string().optional(),
-    })
+    const result = SentimentResponseSchema.parse(response)
+    this.sentimentCache.set(cacheKey, result)
 
-    return schema.parse(response)
+    return cloneSentimentResponse(result)
   }
 
   /**
@@ -147,26 +220,7 @@ export class FinGPTWrapper {
       tenantId
     )
 
-    // Validate response
-    const schema = z.object({
-      anomalies: z.array(
-        z.object({
-          timestamp: z.string(),
-          value: z.number(),
-          severity: z.enum(['low', 'medium', 'high', 'critical']),
-          explanation: z.string().optional(),
-          relatedFactors: z.array(z.string()).optional(),
-        })
-      ),
-      confidence: z.number().min(0).max(1),
-      baselineStats: z.object({
-        mean: z.number(),
-        stdDev: z.number(),
-        trend: z.enum(['increasing', 'decreasing', 'stable']),
-      }),
-    })
-
-    return schema.parse(response)
+    return AnomalyResponseSchema.parse(response)
   }
 
   /**
@@ -193,26 +247,7 @@ export class FinGPTWrapper {
       tenantId
     )
 
-    // Validate response
-    const schema = z.object({
-      forecast: z.array(
-        z.object({
-          timestamp: z.string(),
-          predicted: z.number(),
-          lower: z.number(),
-          upper: z.number(),
-          confidence: z.number().min(0).max(1),
-        })
-      ),
-      model: z.object({
-        type: z.string(),
-        accuracy: z.number().min(0).max(1),
-        parameters: z.record(z.any()),
-      }),
-      insights: z.array(z.string()),
-    })
-
-    return schema.parse(response)
+    return ForecastResponseSchema.parse(response)
   }
 
   /**
@@ -267,21 +302,18 @@ export class FinGPTWrapper {
                 break
             }
 
-            return { id: doc.id, result, success: true }
+            return result
           } catch (error) {
-            return {
-              id: doc.id,
-              error: error instanceof Error ? error.message : 'Unknown error',
-              success: false,
-            }
+            // Each item settles to its final shape here; no status envelope to unpack later
+            return { error: error instanceof Error ? error.message : 'Unknown error' }
           }
         })
       )
 
-      // Aggregate results
-      batchResults.forEach(({ id, result, error, success }) => {
-        results[id] = success ? result : { error }
-      })
+      // Aggregate results in document order
+      for (let j = 0; j < batch.length; j++) {
+        results[batch[j].id] = batchResults[j]
+      }
 
       // Rate limiting delay between batches
       if (i + batchSize < documents.length) {
@@ -261,6 +261,19 @@ const BOMSchema = z.object({
   validFrom: z.string().datetime(),
 })
 
+// Payroll tax rates (mock), built once instead of on every calculation
+const FEDERAL_TAX_RATES: Record<Employee['taxInfo']['filingStatus'], number> = {
+  single: 0.22,
+  married: 0.18,
+  head_of_household: 0.18,
+}
+
+const PAYROLL_TAX_RATES = {
+  state: 0.05,
+  socialSecurity: 0.062,
+  medicare: 0.0145,
+} as const
+
 // Mock Implementation
 export class MockERPNextPayrollService implements ERPNextPayrollService {
   private employees: Map<string, Employee> = new Map()
@@ -368,27 +381,31 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
     employeeIds?: string[]
   ): Promise<PayrollProcess> {
     const processId = randomUUID()
-    let employees = Array.from(this.employees.values())
-
-    if (employeeIds) {
-      employees = employees.filter((emp) => employeeIds.includes(emp.id))
-    }
+    const selectedIds = employeeIds ? new Set(employeeIds) : null
 
-    // Filter active employees only
-    employees = employees.filter((emp) => emp.status === 'active')
+    // Selected (if requested) and active employees only, in a single pass
+    const employees = Array.from(this.employees.values()).filter(
+      (emp) => emp.status === 'active' && (!selectedIds || selectedIds.has(emp.id))
+    )
 
+    // One timestamp for the whole run rather than one per entry
+    const processedAt = new Date().toISOString()
+    const payrollPeriod = `${periodStart}_${periodEnd}`
     const entries: PayrollEntry[] = []
     let totalGrossPay = 0
     let totalNetPay = 0
     let totalTaxes = 0
 
     for (const employee of employees) {
-      const grossPay =
-        employee.salary.basic +
-        Object.values(employee.salary.allowances).reduce((sum, val) => sum + val, 0)
+      const totalAllowances = Object.values(employee.salary.allowances).reduce(
+        (sum, val) => sum + val,
+        0
+      )
+      const grossPay = employee.salary.basic + totalAllowances
 
-      const taxes = await this.calculateTaxes(grossPay, employee.id)
-      const totalTaxDeductions = Object.values(taxes).reduce((sum, val) => sum + val, 0)
+      const taxes = this.computeTaxes(grossPay, employee)
+      const totalTaxDeductions =
+        taxes.federalTax + taxes.stateTax + taxes.socialSecurity + taxes.medicare
 
       const otherDeductions = Object.values(employee.salary.deductions).reduce(
         (sum, val) => sum + val,
@@ -400,20 +417,17 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
       const entry: PayrollEntry = {
         id: randomUUID(),
         employeeId: employee.id,
-        payrollPeriod: `${periodStart}_${periodEnd}`,
+        payrollPeriod,
         grossPay,
         netPay,
         totalDeductions,
-        totalAllowances: Object.values(employee.salary.allowances).reduce(
-          (sum, val) => sum + val,
-          0
-        ),
+        totalAllowances,
         taxDeductions: taxes,
         otherDeductions: employee.salary.deductions,
         hoursWorked: 160, // Standard monthly hours
         overtimeHours: Math.random() * 20,
         status: 'draft',
-        createdAt: new Date().toISOString(),
+        createdAt: processedAt,
       }
 
       entries.push(entry)
@@ -434,7 +448,7 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
       totalNetPay,
       totalTaxes,
       entries,
-      processedAt: new Date().toISOString(),
+      processedAt,
     }
 
     this.payrollProcesses.set(processId, process)
@@ -479,6 +493,8 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
       throw new Error('Payroll process not found')
     }
 
+    const generatedAt = new Date().toISOString()
+
     return process.entries.map((entry) => ({
       employeeId: entry.employeeId,
       payslipData: {
@@ -490,7 +506,7 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
           ...entry.otherDeductions,
         },
         hoursWorked: entry.hoursWorked,
-        generatedAt: new Date().toISOString(),
+        generatedAt,
       },
     }))
   }
@@ -509,17 +525,19 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
       throw new Error('Employee not found')
     }
 
+    return this.computeTaxes(grossPay, employee)
+  }
+
+  // Synchronous core of calculateTaxes; no I/O, so the payroll loop calls it directly
+  private computeTaxes(grossPay: number, employee: Employee): PayrollEntry['taxDeductions'] {
     // Simplified tax calculation (mock rates)
-    const federalRate = employee.taxInfo.filingStatus === 'single' ? 0.22 : 0.18
-    const stateRate = 0.05
-    const socialSecurityRate = 0.062
-    const medicareRate = 0.0145
+    const federalRate = FEDERAL_TAX_RATES[employee.taxInfo.filingStatus]
 
     return {
       federalTax: Math.round(grossPay * federalRate),
-      stateTax: Math.round(grossPay * stateRate),
-      socialSecurity: Math.round(grossPay * socialSecurityRate),
-      medicare: Math.round(grossPay * medicareRate),
+      stateTax: Math.round(grossPay * PAYROLL_TAX_RATES.state),
+      socialSecurity: Math.round(grossPay * PAYROLL_TAX_RATES.socialSecurity),
+      medicare: Math.round(grossPay * PAYROLL_TAX_RATES.medicare),
     }
   }
 
@@ -529,9 +547,12 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
 
     let employees = Array.from(this.employees.values())
     if (employeeIds) {
-      employees = employees.filter((emp) => employeeIds.includes(emp.id))
+      const selectedIds = new Set(employeeIds)
+      employees = employees.filter((emp) => selectedIds.has(emp.id))
     }
 
+    const generatedAt = new Date().toISOString()
+
     return {
       year,
       formsGenerated: employees.length,
@@ -542,12 +563,19 @@ export class MockERPNextPayrollService implements ERPNextPayrollService {
         totalWages: emp.salary.basic,
         federalTaxWithheld: emp.salary.basic * 0.2,
         stateTaxWithheld: emp.salary.basic * 0.05,
-        generatedAt: new Date().toISOString(),
+        generatedAt,
       })),
     }
   }
 }
 
+// BOM optimization cost factors (mock), looked up per request instead of rebuilt
+const BOM_OPTIMIZATION_FACTORS: Record<'cost' | 'quality' | 'time', number> = {
+  cost: 0.85, // 15% cost reduction
+  quality: 1.1, // 10% cost increase for better quality
+  time: 0.95, // 5% cost reduction with faster materials
+}
+
 export class MockERPNextBOMService implements ERPNextBOMService {
   private items: Map<string, Item> = new Map()
   private boms: Map<string, BillOfMaterials> = new Map()
@@ -682,6 +710,7 @@ export class MockERPNextBOMService implements ERPNextBOMService {
 
     const bomNo = `BOM-${String(this.bomCounter++).padStart(6, '0')}`
     const rawMaterialCost = bomData.items.reduce((sum, item) => sum + item.amount, 0)
+    const now = new Date().toISOString()
 
     const bom: BillOfMaterials = {
       id: randomUUID(),
@@ -690,8 +719,8 @@ export class MockERPNextBOMService implements ERPNextBOMService {
       rawMaterialCost,
       totalCost: rawMaterialCost + bomData.operatingCost,
       version: 1,
-      createdAt: new Date().toISOString(),
-      updatedAt: new Date().toISOString(),
+      createdAt: now,
+      updatedAt: now,
     }
 
     this.boms.set(bom.id, bom)
@@ -737,9 +766,14 @@ export class MockERPNextBOMService implements ERPNextBOMService {
     }
 
     const errors: string[] = []
+    let hasCircularDependency = false
 
-    // Check if all items exist and have sufficient stock
+    // Check if all items exist and have sufficient stock, noting self-references on the same pass
     for (const bomItem of bom.items) {
+      if (bomItem.itemId === bom.itemId) {
+        hasCircularDependency = true
+      }
+
       const item = this.items.get(bomItem.itemId)
       if (!item) {
         errors.push(`Item ${bomItem.itemCode} not found`)
@@ -759,7 +793,7 @@ export class MockERPNextBOMService implements ERPNextBOMService {
     }
 
     // Check for circular dependencies (simplified)
-    if (bom.items.some((item) => item.itemId === bom.itemId)) {
+    if (hasCircularDependency) {
       errors.push('Circular dependency detected in BOM')
     }
 
@@ -885,30 +919,15 @@ export class MockERPNextBOMService implements ERPNextBOMService {
     // Simulate optimization
     await new Promise((resolve) => setTimeout(resolve, 2000))
 
-    let optimizationFactor = 1.0
-    let optimizationNote = ''
-
-    switch (criteria) {
-      case 'cost':
-        optimizationFactor = 0.85 // 15% cost reduction
-        optimizationNote = 'Cost-optimized by substituting materials'
-        break
-      case 'quality':
-        optimizationFactor = 1.1 // 10% cost increase for better quality
-        optimizationNote = 'Quality-optimized with premium materials'
-        break
-      case 'time':
-        optimizationFactor = 0.95 // 5% cost reduction with faster materials
-        optimizationNote = 'Time-optimized with readily available materials'
-        break
-    }
+    const optimizationFactor = BOM_OPTIMIZATION_FACTORS[criteria]
+    const rawMaterialCost = bom.rawMaterialCost * optimizationFactor
 
     const optimizedBOM: BillOfMaterials = {
       ...bom,
       id: randomUUID(),
       bomNo: `${bom.bomNo}-OPT`,
-      rawMaterialCost: bom.rawMaterialCost * optimizationFactor,
-      totalCost: bom.rawMaterialCost * optimizationFactor + bom.operatingCost,
+      rawMaterialCost,
+      totalCost: rawMaterialCost + bom.operatingCost,
       version: bom.version + 1,
       updatedAt: new Date().toISOString(),
     }
@@ -183,34 +183,167 @@ const StrategicAnalysisRequestSchema = z.object({
   benchmarks: z.array(z.string()).optional(),
 })
 
+// Monthly seasonal multipliers; the sine cycle repeats every 12 periods, so index by period % 12
+const SEASONAL_FACTORS = Array.from({ length: 12 }, (_, i) => Math.sin((i * Math.PI) / 6) * 0.1 + 1)
+
+// Agent definitions are static, so they are built once and shared; callers only ever get copies
+const FINROBOT_AGENTS: readonly FinRobotAgent[] = [
+  {
+    id: 'forecast-agent-v2',
+    name: 'Advanced Forecasting Agent',
+    type: 'forecasting',
+    capabilities: ['time-series', 'seasonal-adjustment', 'trend-analysis'],
+    confidenceThreshold: 0.85,
+    maxExecutionTime: 30000,
+  },
+  {
+    id: 'strategy-agent-v2',
+    name: 'Strategic Planning Agent',
+    type: 'strategy',
+    capabilities: ['swot-analysis', 'scenario-planning', 'kpi-optimization'],
+    confidenceThreshold: 0.8,
+    maxExecutionTime: 45000,
+  },
+  {
+    id: 'risk-agent-v2',
+    name: 'Risk Assessment Agent',
+    type: 'risk_assessment',
+    capabilities: ['var-calculation', 'stress-testing', 'scenario-analysis'],
+    confidenceThreshold: 0.9,
+    maxExecutionTime: 20000,
+  },
+]
+
+const cloneAgent = (agent: FinRobotAgent): FinRobotAgent => ({
+  ...agent,
+  capabilities: [...agent.capabilities],
+})
+
+// Static recommendation and risk content returned by the mock, shared across calls
+const FORECAST_RECOMMENDATIONS: ForecastResult['recommendations'] = [
+  'Monitor key performance indicators closely',
+  'Prepare contingency plans for scenario variations',
+  'Consider diversification strategies to reduce volatility',
+]
+
+const STRATEGIC_RISK_FACTORS: StrategicAnalysisResult['riskFactors'] = [
+  {
+    factor: 'Market volatility',
+    probability: 0.6,
+    impact: 0.7,
+    mitigation: 'Diversify revenue streams and maintain cash reserves',
+  },
+  {
+    factor: 'Key customer dependency',
+    probability: 0.3,
+    impact: 0.9,
+    mitigation: 'Develop broader customer base and strengthen relationships',
+  },
+]
+
+const RISK_SCENARIOS: RiskAssessmentResult['scenarios'] = [
+  {
+    name: 'Market Correction',
+    probability: 0.3,
+    impact: 0.6,
+    description: 'Broad market downturn affecting portfolio values',
+  },
+  {
+    name: 'Sector Rotation',
+    probability: 0.5,
+    impact: 0.4,
+    description: 'Shift in investor preference across sectors',
+  },
+  {
+    name: 'Regulatory Changes',
+    probability: 0.2,
+    impact: 0.8,
+    description: 'New regulations impacting business operations',
+  },
+]
+
+const RISK_RECOMMENDATIONS: RiskAssessmentResult['recommendations'] = [
+  {
+    action: 'Implement dynamic hedging strategies',
+    urgency: 'short-term',
+    expectedReduction: 15,
+  },
+  {
+    action: 'Diversify across asset classes',
+    urgency: 'long-term',
+    expectedReduction: 25,
+  },
+  {
+    action: 'Enhance monitoring systems',
+    urgency: 'immediate',
+    expectedReduction: 10,
+  },
+]
+
+const RISK_FACTORS: Record<string, string[]> = {
+  market: ['Volatility', 'Liquidity', 'Correlation'],
+  credit: ['Default risk', 'Concentration', 'Rating changes'],
+  operational: ['Process failures', 'Human error', 'Technology risk'],
+  liquidity: ['Funding risk', 'Market liquidity', 'Cash flow'],
+  regulatory: ['Compliance', 'Policy changes', 'Legal risk'],
+}
+
+// Static strategic analysis content, shared across calls
+const STRATEGIC_SWOT: StrategicAnalysisResult['analysis'] = {
+  strengths: [
+    'Strong revenue growth trajectory',
+    'Diverse customer base',
+    'Operational efficiency improvements',
+  ],
+  weaknesses: [
+    'High dependency on key markets',
+    'Limited cash reserves',
+    'Technology infrastructure gaps',
+  ],
+  opportunities: [
+    'Market expansion potential',
+    'Digital transformation initiatives',
+    'Strategic partnerships',
+  ],
+  threats: ['Increased competition', 'Regulatory changes', 'Economic uncertainty'],
+}
+
+const STRATEGIC_ACTION_PLAN: StrategicAnalysisResult['actionPlan'] = [
+  {
+    priority: 'high',
+    action: 'Develop digital transformation roadmap',
+    expectedImpact: '15-20% efficiency improvement',
+    timeline: '6-12 months',
+    resources: ['Technology team', 'External consultants'],
+  },
+  {
+    priority: 'medium',
+    action: 'Expand into adjacent markets',
+    expectedImpact: '10-15% revenue increase',
+    timeline: '12-18 months',
+    resources: ['Sales team', 'Market research'],
+  },
+]
+
+// Canned per-agent-type results for multi-agent analysis; types without an entry are skipped
+const AGENT_TYPE_RESULTS: Partial<Record<FinRobotAgent['type'], Record<string, unknown>>> = {
+  forecasting: {
+    forecast: 'Positive growth expected',
+    confidence: 0.85,
+  },
+  analysis: {
+    recommendation: 'Moderate risk, balanced approach',
+    confidence: 0.78,
+  },
+  risk_assessment: {
+    riskLevel: 'Medium',
+    confidence: 0.92,
+  },
+}
+
 // Mock Implementation
 export class MockFinRobotService implements FinRobotService {
-  private agents: FinRobotAgent[] = [
-    {
-      id: 'forecast-agent-v2',
-      name: 'Advanced Forecasting Agent',
-      type: 'forecasting',
-      capabilities: ['time-series', 'seasonal-adjustment', 'trend-analysis'],
-      confidenceThreshold: 0.85,
-      maxExecutionTime: 30000,
-    },
-    {
-      id: 'strategy-agent-v2',
-      name: 'Strategic Planning Agent',
-      type: 'strategy',
-      capabilities: ['swot-analysis', 'scenario-planning', 'kpi-optimization'],
-      confidenceThreshold: 0.8,
-      maxExecutionTime: 45000,
-    },
-    {
-      id: 'risk-agent-v2',
-      name: 'Risk Assessment Agent',
-      type: 'risk_assessment',
-      capabilities: ['var-calculation', 'stress-testing', 'scenario-analysis'],
-      confidenceThreshold: 0.9,
-      maxExecutionTime: 20000,
-    },
-  ]
+  private readonly agents = FINROBOT_AGENTS
 
   async executeForecast(request: FinancialForecastRequest): Promise<ForecastResult> {
     // Validate input
@@ -227,7 +360,7 @@ export class MockFinRobotService implements FinRobotService {
     const predictions = Array.from({ length: request.forecastPeriods }, (_, i) => {
       const period = i + 1
       const trendAdjustment = trend * period
-      const seasonalFactor = Math.sin((period * Math.PI) / 6) * 0.1 + 1
+      const seasonalFactor = SEASONAL_FACTORS[period % 12]
       const randomFactor = (Math.random() - 0.5) * volatility
 
       const predictedValue = baseValue * seasonalFactor + trendAdjustment + randomFactor
@@ -263,11 +396,7 @@ export class MockFinRobotService implements FinRobotService {
           description: 'Mixed signals from leading economic indicators',
         },
       ],
-      recommendations: [
-        'Monitor key performance indicators closely',
-        'Prepare contingency plans for scenario variations',
-        'Consider diversification strategies to reduce volatility',
-      ],
+      recommendations: [...FORECAST_RECOMMENDATIONS],
       metadata: {
         modelUsed: request.modelType || 'ensemble',
         trainingSize: request.data.length,
@@ -292,22 +421,10 @@ export class MockFinRobotService implements FinRobotService {
     return {
       overallScore: Math.round(65 + Math.random() * 25), // 65-90 range
       analysis: {
-        strengths: [
-          'Strong revenue growth trajectory',
-          'Diverse customer base',
-          'Operational efficiency improvements',
-        ],
-        weaknesses: [
-          'High dependency on key markets',
-          'Limited cash reserves',
-          'Technology infrastructure gaps',
-        ],
-        opportunities: [
-          'Market expansion potential',
-          'Digital transformation initiatives',
-          'Strategic partnerships',
-        ],
-        threats: ['Increased competition', 'Regulatory changes', 'Economic uncertainty'],
+        strengths: [...STRATEGIC_SWOT.strengths],
+        weaknesses: [...STRATEGIC_SWOT.weaknesses],
+        opportunities: [...STRATEGIC_SWOT.opportunities],
+        threats: [...STRATEGIC_SWOT.threats],
       },
       kpis: [
         {
@@ -325,36 +442,11 @@ export class MockFinRobotService implements FinRobotService {
           recommendation: 'Optimize operational costs and pricing strategy',
         },
       ],
-      actionPlan: [
-        {
-          priority: 'high',
-          action: 'Develop digital transformation roadmap',
-          expectedImpact: '15-20% efficiency improvement',
-          timeline: '6-12 months',
-          resources: ['Technology team', 'External consultants'],
-        },
-        {
-          priority: 'medium',
-          action: 'Expand into adjacent markets',
-          expectedImpact: '10-15% revenue increase',
-          timeline: '12-18 months',
-          resources: ['Sales team', 'Market research'],
-        },
-      ],
-      riskFactors: [
-        {
-          factor: 'Market volatility',
-          probability: 0.6,
-          impact: 0.7,
-          mitigation: 'Diversify revenue streams and maintain cash reserves',
-        },
-        {
-          factor: 'Key customer dependency',
-          probability: 0.3,
-          impact: 0.9,
-          mitigation: 'Develop broader customer base and strengthen relationships',
-        },
-      ],
+      actionPlan: STRATEGIC_ACTION_PLAN.map((step) => ({
+        ...step,
+        resources: [...step.resources],
+      })),
+      riskFactors: STRATEGIC_RISK_FACTORS.map((riskFactor) => ({ ...riskFactor })),
     }
   }
 
@@ -372,48 +464,13 @@ export class MockFinRobotService implements FinRobotService {
         trend: Math.random() > 0.5 ? 'increasing' : 'stable',
         factors: this.getRiskFactors(type),
       })),
-      scenarios: [
-        {
-          name: 'Market Correction',
-          probability: 0.3,
-          impact: 0.6,
-          description: 'Broad market downturn affecting portfolio values',
-        },
-        {
-          name: 'Sector Rotation',
-          probability: 0.5,
-          impact: 0.4,
-          description: 'Shift in investor preference across sectors',
-        },
-        {
-          name: 'Regulatory Changes',
-          probability: 0.2,
-          impact: 0.8,
-          description: 'New regulations impacting business operations',
-        },
-      ],
-      recommendations: [
-        {
-          action: 'Implement dynamic hedging strategies',
-          urgency: 'short-term',
-          expectedReduction: 15,
-        },
-        {
-          action: 'Diversify across asset classes',
-          urgency: 'long-term',
-          expectedReduction: 25,
-        },
-        {
-          action: 'Enhance monitoring systems',
-          urgency: 'immediate',
-          expectedReduction: 10,
-        },
-      ],
+      scenarios: RISK_SCENARIOS.map((scenario) => ({ ...scenario })),
+      recommendations: RISK_RECOMMENDATIONS.map((recommendation) => ({ ...recommendation })),
     }
   }
 
   async getAvailableAgents(): Promise<FinRobotAgent[]> {
-    return [...this.agents]
+    return this.agents.map(cloneAgent)
   }
 
   async getAgentById(id: string): Promise<FinRobotAgent> {
@@ -421,7 +478,7 @@ export class MockFinRobotService implements FinRobotService {
     if (!agent) {
       throw new Error(`Agent ${id} not found`)
     }
-    return agent
+    return cloneAgent(agent)
   }
 
   async executeMultiAgentAnalysis(
@@ -438,29 +495,14 @@ export class MockFinRobotService implements FinRobotService {
     const results: Record<string, unknown> = {}
     const conflicts: string[] = []
 
-    for (const agentId of agents) {
-      const agent = await this.getAgentById(agentId)
+    // Resolve all agents concurrently rather than awaiting each lookup in turn
+    const resolvedAgents = await Promise.all(agents.map((agentId) => this.getAgentById(agentId)))
 
+    for (const agent of resolvedAgents) {
       // Simulate agent-specific analysis
-      switch (agent.type) {
-        case 'forecasting':
-          results[agentId] = {
-            forecast: 'Positive growth expected',
-            confidence: 0.85,
-          }
-          break
-        case 'analysis':
-          results[agentId] = {
-            recommendation: 'Moderate risk, balanced approach',
-            confidence: 0.78,
-          }
-          break
-        case 'risk_assessment':
-          results[agentId] = {
-            riskLevel: 'Medium',
-            confidence: 0.92,
-          }
-          break
+      const agentResult = AGENT_TYPE_RESULTS[agent.type]
+      if (agentResult) {
+        results[agent.id] = { ...agentResult }
       }
     }
 
@@ -490,19 +532,43 @@ export class MockFinRobotService implements FinRobotService {
 
   private calculateVolatility(data: FinancialDataPoint[]): number {
     if (data.length < 2) return 0.1
-    const values = data.map((d) => d.value)
-    const mean = values.reduce((a, b) => a + b, 0) / values.length
-    const variance = values.reduce((acc, val) => acc + Math.pow(val - mean, 2), 0) / values.length
+
+    // Single-pass (Welford) mean and variance; no intermediate values array
+    let mean = 0
+    let sumSquaredDiffs = 0
+    for (let i = 0; i < data.length; i++) {
+      const value = data[i].value
+      const delta = value - mean
+      mean += delta / (i + 1)
+      sumSquaredDiffs += delta * (value - mean)
+    }
+    const variance = sumSquaredDiffs / data.length
     return Math.sqrt(variance) / mean
   }
 
   private calculateGrowthRate(data: FinancialDataPoint[]): number {
     if (data.length < 2) return 0
-    const sortedData = data.sort(
-      (a, b) => new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime()
-    )
-    const first = sortedData[0].value
-    const last = sortedData[sortedData.length - 1].value
+
+    // Only the earliest and latest points matter, so a linear scan replaces a full sort
+    let earliest = data[0]
+    let latest = data[0]
+    let earliestTime = new Date(earliest.timestamp).getTime()
+    let latestTime = earliestTime
+
+    for (let i = 1; i < data.length; i++) {
+      const time = new Date(data[i].timestamp).getTime()
+      if (time < earliestTime) {
+        earliest = data[i]
+        earliestTime = time
+      }
+      if (time >= latestTime) {
+        latest = data[i]
+        latestTime = time
+      }
+    }
+
+    const first = earliest.value
+    const last = latest.value
     return (last - first) / first
   }
 
@@ -516,14 +582,7 @@ export class MockFinRobotService implements FinRobotService {
   }
 
   private getRiskFactors(riskType: string): string[] {
-    const factorMap: Record<string, string[]> = {
-      market: ['Volatility', 'Liquidity', 'Correlation'],
-      credit: ['Default risk', 'Concentration', 'Rating changes'],
-      operational: ['Process failures', 'Human error', 'Technology risk'],
-      liquidity: ['Funding risk', 'Market liquidity', 'Cash flow'],
-      regulatory: ['Compliance', 'Policy changes', 'Legal risk'],
-    }
-    return factorMap[riskType] || ['General risk factors']
+    return [...(RISK_FACTORS[riskType] || ['General risk factors'])]
   }
 }
 